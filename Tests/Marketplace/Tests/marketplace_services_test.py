@@ -20,7 +20,8 @@ from pathlib import Path
 from Tests.Marketplace.marketplace_services import Pack, input_to_list, get_valid_bool, convert_price, \
     get_updated_server_version, load_json, \
     store_successful_and_failed_packs_in_ci_artifacts, is_ignored_pack_file, \
-    is_the_only_rn_in_block, get_pull_request_numbers_from_file, remove_old_versions_from_changelog
+    is_the_only_rn_in_block, get_pull_request_numbers_from_file, remove_old_versions_from_changelog, \
+    get_id_set_display_names
 from Tests.Marketplace.marketplace_constants import Changelog, PackStatus, PackFolders, Metadata, GCPConfig, BucketUploadFlow, \
     PackTags, XSOAR_START_TAG, XSOAR_END_TAG, XSOAR_SAAS_START_TAG, XSOAR_SAAS_END_TAG, XSOAR_ON_PREM_TAG, \
     XSOAR_ON_PREM_END_TAG, XSOAR_MP, XSIAM_MP, XSOAR_SAAS_MP
@@ -1709,10 +1710,13 @@ class TestFilterChangelog:
             When:
                 - Filtering out the entries by the given entities display names from id-set.
             Then:
-                - Ensure the filtered entries resulte is as expected.
+                - Ensure the filtered entries resulte is as expected, with and without the id-set display names index.
         """
         assert dummy_pack.filter_entries_by_display_name(self.RN_ENTRIES_DICTIONARY, id_set) == \
             expected_result
+        assert dummy_pack.filter_entries_by_display_name(self.RN_ENTRIES_DICTIONARY, id_set,
+                                                         id_set_display_names=get_id_set_display_names(id_set)) == \
+            expected_result
 
     @pytest.mark.parametrize('changelog_entry, marketplace, id_set, expected_rn', [
         ({Changelog.RELEASE_NOTES: '#### Integrations\n##### Display Name\n- Some entry 1.\n- Some entry 2.'},
@@ -1830,6 +1834,27 @@ class TestImagesUpload:
 
         assert dummy_pack.remove_contrib_suffix_from_name(display_name) == "Integration Name"
 
+    @pytest.mark.parametrize("integration_path_basename, integration_dirs, unified_integrations, expected_result", [
+        ('integration-HelloWorld.yml', ['HelloWorld'], [], True),
+        ('integration-HelloWorld.yml', [], ['integration-HelloWorld.yml'], True),
+        ('integration-HelloWorld.yml', ['OtherIntegration'], [], False),
+        ('integration-HelloWorld_yml', ['HelloWorld_yml'], [], False),
+    ])
+    def test_need_to_upload_integration_image(self, integration_path_basename, integration_dirs, unified_integrations,
+                                              expected_result):
+        """
+           Given:
+               - Image data of an integration, the detected integration dirs and unified integrations.
+           When:
+               - Checking whether the integration image should be uploaded.
+           Then:
+               - Validates the image is uploaded only for detected integration dirs or unified integrations.
+       """
+        image_data = {'integration_path_basename': integration_path_basename}
+
+        assert Pack.need_to_upload_integration_image(image_data, integration_dirs,
+                                                     unified_integrations) is expected_result
+
     def test_copy_integration_images(self, mocker, dummy_pack):
         """
            Given:
@@ -33,10 +33,13 @@ from demisto_sdk.commands.common.constants import (MarketplaceVersions, Marketpl
                                                    PACK_METADATA_REQUIRE_RN_FIELDS)
 from Utils.release_notes_generator import aggregate_release_notes_for_marketplace, merge_version_blocks, construct_entities_block
 from Tests.scripts.utils import logging_wrapper as logging
+from Tests.scripts.utils.yaml_loader import SafeLoader
 
-PULL_REQUEST_PATTERN = '\(#(\d+)\)'
-TAGS_SECTION_PATTERN = '(.|\s)+?'
+PULL_REQUEST_PATTERN = re.compile(r'\(#(\d+)\)')
+TAGS_SECTION_PATTERN = r'[\s\S]+?'
 SPECIAL_DISPLAY_NAMES_PATTERN = re.compile(r'- \*\*(.+?)\*\*')
+RN_COMMENT_PATTERN = re.compile(r'<\!--.*?-->', flags=re.DOTALL)
+SVG_BACKGROUND_PATTERN = re.compile(r'_([^_]+)\.svg$')
 MAX_TOVERSION = '99.99.99'
 
 
@@ -508,7 +511,7 @@ class Pack:
 
     @staticmethod
     def _clean_release_notes(release_notes_lines):
-        return re.sub(r'<\!--.*?-->', '', release_notes_lines, flags=re.DOTALL)
+        return RN_COMMENT_PATTERN.sub('', release_notes_lines)
 
     def _parse_pack_metadata(self, parse_dependencies: bool = False):
         """ Parses pack metadata according to issue #19786 and #20091. Part of field may change over the time.
@@ -528,7 +531,7 @@ class Pack:
     def _get_updated_changelog_entry(self, changelog: dict, version: str, release_notes: str = None,
                                      version_display_name: str = None, build_number_with_prefix: str = None,
                                      released_time: str = None, pull_request_numbers=None, marketplace: str = 'xsoar',
-                                     id_set: dict = None):
+                                     id_set: dict = None, id_set_display_names: dict[str, set] | None = None):
         """
         Args:
             changelog (dict): The changelog from the production bucket.
@@ -538,6 +541,8 @@ class Pack:
             build_number_with_prefix(srt): the build number to modify the entry to, including the prefix R (if present).
             released_time: The released time to update the entry with.
             marketplace (str): The marketplace to which the upload is made.
+            id_set (dict): The content id set dict.
+            id_set_display_names (dict): The display names of the id set entities by id set key.
 
         """
         id_set = id_set if id_set else {}
@@ -556,7 +561,8 @@ class Pack:
             changelog_entry=changelog_entry,
             version=version,
             marketplace=marketplace,
-            id_set=id_set
+            id_set=id_set,
+            id_set_display_names=id_set_display_names
         )
         changelog_entry[Changelog.DISPLAY_NAME] = f'{version_display_name} - {build_number_with_prefix}'
         changelog_entry[Changelog.RELEASED] = released_time if released_time else changelog_entry[Changelog.RELEASED]
@@ -565,7 +571,7 @@ class Pack:
 
     def _create_changelog_entry(self, release_notes, version_display_name, build_number,
                                 new_version=True, initial_release=False, pull_request_numbers=None,
-                                marketplace='xsoar', id_set=None, is_override=False):
+                                marketplace='xsoar', id_set=None, is_override=False, id_set_display_names=None):
         """ Creates dictionary entry for changelog.
 
         Args:
@@ -576,6 +582,7 @@ class Pack:
             initial_release (bool): whether the entry is an initial release or not.
             id_set (dict): The content id set dict.
             is_override (bool): Whether the flow overrides the packs on cloud storage.
+            id_set_display_names (dict): The display names of the id set entities by id set key.
         Returns:
             dict: release notes entry of changelog
             bool: Whether the pack is not updated
@@ -613,7 +620,7 @@ class Pack:
             return self.filter_changelog_entries(
                 entry_result,
                 version_display_name,
-                marketplace, id_set
+                marketplace, id_set, id_set_display_names
             )
 
         return entry_result, False
@@ -631,13 +638,12 @@ class Pack:
                     shutil.rmtree(f'{self._pack_path}/{directory}')
                     logging.debug(f"Deleted {directory} directory from {self._pack_name} pack")
 
+            unwanted_files = {Pack.AUTHOR_IMAGE_NAME, Pack.PACK_METADATA, *self._remove_files_list}
             for root, _dirs, files in os.walk(self._pack_path, topdown=True):
                 for pack_file in files:
                     full_file_path = os.path.join(root, pack_file)
                     # removing unwanted files
-                    if pack_file.startswith('.') \
-                            or pack_file in [Pack.AUTHOR_IMAGE_NAME, Pack.PACK_METADATA] \
-                            or pack_file in self._remove_files_list:
+                    if pack_file.startswith('.') or pack_file in unwanted_files:
                         os.remove(full_file_path)
                         logging.debug(f"Deleted pack {pack_file} file for {self._pack_name} pack")
                         continue
@@ -1140,8 +1146,10 @@ class Pack:
         lower_versions: list = []
         higher_versions: list = []
         same_block_versions_dict: dict = {}
+        given_version = Version(version)
         for item in changelog:  # divide the versions into lists of lower and higher than given version
-            (lower_versions if Version(item) < Version(version) else higher_versions).append(Version(item))
+            item_version = Version(item)
+            (lower_versions if item_version < given_version else higher_versions).append(item_version)
         higher_nearest_version = min(higher_versions)
         lower_versions = lower_versions + lowest_version  # if the version is 1.0.0, ensure lower_versions is not empty
         lower_nearest_version = max(lower_versions)
@@ -1258,7 +1266,7 @@ class Pack:
         ])
 
     def prepare_release_notes(self, index_folder_path, build_number, diff_files_list=None,
-                              marketplace='xsoar', id_set=None, is_override=False):
+                              marketplace='xsoar', id_set=None, is_override=False, id_set_display_names=None):
         """
         Handles the creation and update of the changelog.json files.
         Args:
@@ -1267,6 +1275,7 @@ class Pack:
             modified_rn_files_paths (list): list of paths of the pack's modified file
             marketplace (str): The marketplace to which the upload is made.
             is_override (bool): Whether the flow overrides the packs on cloud storage.
+            id_set_display_names (dict): The display names of the id set entities by id set key.
         Returns:
             bool: whether the operation succeeded.
             bool: whether running build has not updated pack release notes.
@@ -1319,6 +1328,7 @@ class Pack:
                                                                    {}).get(Changelog.PULL_REQUEST_NUMBERS, []),
                                 marketplace=marketplace,
                                 id_set=id_set,
+                                id_set_display_names=id_set_display_names,
                                 is_override=is_override
                             )
 
@@ -1331,6 +1341,7 @@ class Pack:
                                 new_version=True,
                                 marketplace=marketplace,
                                 id_set=id_set,
+                                id_set_display_names=id_set_display_names,
                             )
 
                         if version_changelog:
@@ -1349,7 +1360,8 @@ class Pack:
                                     release_notes=modified_release_notes_lines,
                                     pull_request_numbers=all_relevant_pr_nums_for_unified,
                                     marketplace=marketplace,
-                                    id_set=id_set
+                                    id_set=id_set,
+                                    id_set_display_names=id_set_display_names
                                 )
                                 changelog[version] = updated_entry
 
@@ -1363,7 +1375,7 @@ class Pack:
 
                     else:
                         # allow changing the initial changelog version
-                        first_key_in_changelog = list(changelog.keys())[0]
+                        first_key_in_changelog = next(iter(changelog))
                         version_changelog, not_updated_build = self._create_changelog_entry(
                             release_notes=self.description,
                             version_display_name=first_key_in_changelog,
@@ -1371,7 +1383,8 @@ class Pack:
                             initial_release=True,
                             new_version=False,
                             marketplace=marketplace,
-                            id_set=id_set)
+                            id_set=id_set,
+                            id_set_display_names=id_set_display_names)
 
                         if version_changelog:
                             changelog[first_key_in_changelog] = version_changelog
@@ -1406,7 +1419,8 @@ class Pack:
                     new_version=True,
                     initial_release=True,
                     marketplace=marketplace,
-                    id_set=id_set
+                    id_set=id_set,
+                    id_set_display_names=id_set_display_names
                 )
 
                 if version_changelog:
@@ -1436,7 +1450,8 @@ class Pack:
         finally:
             return task_status, not_updated_build, pack_versions_to_keep
 
-    def filter_changelog_entries(self, changelog_entry: dict, version: str, marketplace: str, id_set: dict):
+    def filter_changelog_entries(self, changelog_entry: dict, version: str, marketplace: str, id_set: dict,
+                                 id_set_display_names: dict[str, set] | None = None):
         """
         Filters the changelog entries by the entities that are given from id-set.
         This is to avoid RN entries/changes/messages that are not relevant to the current marketplace.
@@ -1452,6 +1467,7 @@ class Pack:
             version: The changelog's version.
             marketplace: The marketplace to which the upload is made.
             id_set: The id set dict.
+            id_set_display_names: The display names of the id set entities by id set key.
 
         Returns:
             (dict) The filtered changelog entry.
@@ -1472,7 +1488,8 @@ class Pack:
             return changelog_entry, False
 
         filtered_release_notes_from_tags = self.filter_headers_without_entries(release_notes_dict)  # type: ignore[arg-type]
-        filtered_release_notes = self.filter_entries_by_display_name(filtered_release_notes_from_tags, id_set, marketplace)
+        filtered_release_notes = self.filter_entries_by_display_name(filtered_release_notes_from_tags, id_set, marketplace,
+                                                                     id_set_display_names)
 
         # Convert the RN dict to string
         final_release_notes = construct_entities_block(filtered_release_notes).strip()
@@ -1485,7 +1502,8 @@ class Pack:
         return changelog_entry, False
 
     @staticmethod
-    def filter_entries_by_display_name(release_notes: dict, id_set: dict, marketplace="xsoar"):
+    def filter_entries_by_display_name(release_notes: dict, id_set: dict, marketplace="xsoar",
+                                       id_set_display_names: dict[str, set] | None = None):
         """
         Filters the entries by display names and also handles special entities that their display name is not an header.
 
@@ -1493,6 +1511,7 @@ class Pack:
             release_notes (dict): The release notes in a dict.
             display_names (list): The display names that are give from the id-set.
             rn_header (str): The release notes entity header.
+            id_set_display_names (dict): The display names of the id set entities by id set key.
 
         Returns:
             (dict) The filtered release notes entries.
@@ -1506,14 +1525,16 @@ class Pack:
                 logging.debug(f"Searching display name '{content_item_display_name}' with rn header "
                               f"'{content_type}' in in id set.")
                 if content_item_display_name != '[special_msg]' and not is_content_item_in_id_set(
-                        content_item_display_name.replace("New: ", ""), content_type, id_set, marketplace):
+                        content_item_display_name.replace("New: ", ""), content_type, id_set, marketplace,
+                        id_set_display_names):
                     continue
 
                 if content_item_display_name == '[special_msg]':
                     extracted_names_from_rn = SPECIAL_DISPLAY_NAMES_PATTERN.findall(content_item_rn_notes)
 
                     for name in extracted_names_from_rn:
-                        if not is_content_item_in_id_set(name.replace("New: ", ""), content_type, id_set, marketplace):
+                        if not is_content_item_in_id_set(name.replace("New: ", ""), content_type, id_set, marketplace,
+                                                         id_set_display_names):
                             content_item_rn_notes = content_item_rn_notes.replace(f'- **{name}**', '').strip()
 
                     if not content_item_rn_notes:
@@ -1963,7 +1984,7 @@ class Pack:
                 image_data['repo_image_path'] = os.path.join(root, pack_file)
             elif pack_file.endswith('.yml'):
                 with open(os.path.join(root, pack_file)) as integration_file:
-                    integration_yml = yaml.safe_load(integration_file)
+                    integration_yml = yaml.load(integration_file, Loader=SafeLoader)
                     image_data['display_name'] = integration_yml.get('display', '')
 
         return image_data
@@ -1983,7 +2004,7 @@ class Pack:
 
         if pack_file_path.endswith('.yml'):
             with open(pack_file_path) as integration_file:
-                integration_yml = yaml.safe_load(integration_file)
+                integration_yml = yaml.load(integration_file, Loader=SafeLoader)
 
             image_data['display_name'] = integration_yml.get('display', '')
             # create temporary file of base64 decoded data
@@ -2088,8 +2109,11 @@ class Pack:
             bool: True if we need to upload the image or not
         """
         integration_path_basename = image_data['integration_path_basename']
+        is_integration_file = integration_path_basename.startswith('integration-') \
+            and integration_path_basename.endswith('.yml')
+        integration_dir = integration_path_basename.removeprefix('integration-').removesuffix('.yml')
         return any([
-            re.findall(BucketUploadFlow.INTEGRATION_DIR_REGEX, integration_path_basename)[0] in integration_dirs,
+            is_integration_file and integration_dir in integration_dirs,
             integration_path_basename in unified_integrations
         ])
 
@@ -2461,7 +2485,7 @@ class Pack:
         """
         # Handle cases of one BC version in entry.
         if len(bc_version_to_text) == 1:
-            return list(bc_version_to_text.values())[0]
+            return next(iter(bc_version_to_text.values()))
         # Handle cases of two or more BC versions in entry.
         text_of_bc_versions, bc_without_text = self._split_bc_versions_with_and_without_text(bc_version_to_text)
 
@@ -2691,9 +2715,9 @@ class Pack:
             integration_yaml_path = glob.glob(os.path.join(*integration_dir, '*.yml'))
 
             with open(integration_yaml_path[0]) as pack_file:
-                integration_yaml_content = yaml.safe_load(pack_file)
+                integration_yaml_content = yaml.load(pack_file, Loader=SafeLoader)
 
-            image_background: list[str] = re.findall(r'_([^_]+)\.svg$', dynamic_dashboard_image)
+            image_background: list[str] = SVG_BACKGROUND_PATTERN.findall(dynamic_dashboard_image)
             if not image_background or image_background[0].lower() not in ['dark', 'light']:
                 raise BaseException(f"Could not find background for image in path {dynamic_dashboard_image}.\nThe svg image "
                                     "file should be named either as `<ImageName>_dark.svg` or `<ImageName>_light.svg`")
@@ -2887,7 +2911,7 @@ def get_pull_request_numbers_from_file(file_path) -> list[int]:
         A list of relevant pull request numbers for the given file
     """
     log_info: str = git.Git(CONTENT_ROOT_PATH).log(file_path)
-    return re.findall(PULL_REQUEST_PATTERN, log_info)
+    return PULL_REQUEST_PATTERN.findall(log_info)
 
 
 def get_upload_data(packs_results_file_path: str, stage: str) -> tuple[dict, dict, dict, dict, dict]:
@@ -3335,9 +3359,9 @@ def is_the_only_rn_in_block(release_notes_dir: str, version: str, changelog: dic
     for filename in filter_dir_files_by_extension(release_notes_dir, '.md'):
         current_version = underscore_file_name_to_dotted_version(filename)
         all_rn_versions.append(Version(current_version))
-    lower_versions_all_versions = [item for item in all_rn_versions if item < Version(version)] + lowest_version
-    lower_versions_in_changelog = [Version(item) for item in changelog if
-                                   Version(item) < Version(version)] + lowest_version
+    given_version = Version(version)
+    lower_versions_all_versions = [item for item in all_rn_versions if item < given_version] + lowest_version
+    lower_versions_in_changelog = [item for item in map(Version, changelog) if item < given_version] + lowest_version
     return max(lower_versions_all_versions) == max(lower_versions_in_changelog)
 
 
@@ -3382,7 +3406,25 @@ def is_content_item_in_graph(display_name: str, content_type, marketplace) -> bo
         return bool(res)
 
 
-def is_content_item_in_id_set(display_name: str, rn_header: str, id_set: dict, marketplace="xsoar"):
+def get_id_set_display_names(id_set: dict) -> dict[str, set]:
+    """
+    Maps the id set keys of the release notes headers to the display names of their entities.
+
+    Args:
+        id_set: id set dict.
+
+    Returns:
+        (dict) The display names of the id set entities by id set key.
+    """
+    return {
+        id_set_key: {list(id_set_entity.values())[0].get('display_name')
+                     for id_set_entity in id_set.get(id_set_key, [])}
+        for id_set_key in set(RN_HEADER_TO_ID_SET_KEYS.values())
+    }
+
+
+def is_content_item_in_id_set(display_name: str, rn_header: str, id_set: dict, marketplace="xsoar",
+                              id_set_display_names: dict[str, set] | None = None):
     """
     Get the full entity dict from the id set of the entity given it's display name, if it does not exist in the id set
     return None.
@@ -3391,6 +3433,8 @@ def is_content_item_in_id_set(display_name: str, rn_header: str, id_set: dict, m
         display_name: The display name of the entity (content item).
         rn_header: The release notes header of the entity.
         id_set: id set dict.
+        id_set_display_names: The display names of the id set entities by id set key, see get_id_set_display_names.
+            If not given, the id set entities are scanned instead.
 
     Returns:
         (bool) True if the item exists in id set, otherwise False.
@@ -3409,9 +3453,14 @@ def is_content_item_in_id_set(display_name: str, rn_header: str, id_set: dict, m
             return False
         return True
 
-    for id_set_entity in id_set[RN_HEADER_TO_ID_SET_KEYS[rn_header]]:
-        if list(id_set_entity.values())[0]['display_name'] == display_name:
+    id_set_key = RN_HEADER_TO_ID_SET_KEYS[rn_header]
+    if id_set_display_names is not None:
+        if display_name in id_set_display_names.get(id_set_key, set()):
             return True
+    else:
+        for id_set_entity in id_set[id_set_key]:
+            if list(id_set_entity.values())[0]['display_name'] == display_name:
+                return True
 
     logging.debug(f"Could not find the entity with display name {display_name} in id_set.")
     return False
@@ -3452,11 +3501,12 @@ def remove_old_versions_from_changelog(changelog: dict):
                 last_year_versions.append(version)
 
         # get versions with same minor version
-        if save_last_minor_versions and Version(version).minor == last_version.minor \
-                and Version(version).major == last_version.major:
-            last_same_minor_versions.append(version)
-            if prev_version and prev_version not in last_same_minor_versions:
-                last_same_minor_versions.append(prev_version)
+        if save_last_minor_versions:
+            parsed_version = Version(version)
+            if parsed_version.minor == last_version.minor and parsed_version.major == last_version.major:
+                last_same_minor_versions.append(version)
+                if prev_version and prev_version not in last_same_minor_versions:
+                    last_same_minor_versions.append(prev_version)
 
         prev_version = version
 
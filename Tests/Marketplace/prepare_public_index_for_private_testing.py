@@ -177,11 +177,11 @@ def add_private_packs_from_dummy_index(private_packs, dummy_index_blob):
     with open(dummy_index_json_path) as index_file:
         index_json = json.load(index_file)
         packs_from_dummy_index = index_json.get('packs', [])
+        dummy_index_packs_ids = {dummy_index_pack['id'] for dummy_index_pack in packs_from_dummy_index}
         for pack in private_packs:
-            is_pack_in_dummy_index = any(
-                [pack['id'] == dummy_index_pack['id'] for dummy_index_pack in packs_from_dummy_index])
-            if not is_pack_in_dummy_index:
+            if pack['id'] not in dummy_index_packs_ids:
                 packs_from_dummy_index.append(pack)
+                dummy_index_packs_ids.add(pack['id'])
 
     os.remove(downloaded_dummy_index_path)
     shutil.rmtree(extracted_dummy_index_path)
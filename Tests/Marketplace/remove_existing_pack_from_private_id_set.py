@@ -20,7 +20,7 @@ def remove_old_pack_from_private_id_set(private_id_set, new_pack_name):
         if content_entity != "Packs":
             entity_value_list = []
             for content_entity_value in content_entity_value_list:
-                content_item_value = content_entity_value.get(list(content_entity_value.keys())[0], {})
+                content_item_value = next(iter(content_entity_value.values()), {})
                 if content_item_value.get('pack') != new_pack_name:
                     entity_value_list.append(content_entity_value)
 
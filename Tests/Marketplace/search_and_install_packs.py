@@ -36,6 +36,9 @@ from Tests.test_content import get_server_numeric_version
 
 PACK_PATH_VERSION_REGEX = re.compile(fr'^{GCPConfig.PRODUCTION_STORAGE_BASE_PATH}/[A-Za-z0-9-_.]+/(\d+\.\d+\.\d+)/[A-Za-z0-9-_.]'  # noqa: E501
                                      r'+\.zip$')
+MALFORMED_PACK_PATTERN = re.compile(r'invalid version [0-9.]+ for pack with ID ([\w_-]+)')
+# brackets and spaces around the pack ids listed in an installation error
+PACK_IDS_LIST_REMOVED_CHARS = str.maketrans('', '', '[] ')
 WLM_TASK_FAILED_ERROR_CODE = 101704
 
 GITLAB_SESSION = Session()
@@ -192,13 +195,11 @@ def find_malformed_pack_id(body: str) -> list:
             else:
                 # the errors are returned as a list of error
                 errors_info = response_info.get('errors', [])
-            malformed_pack_pattern = re.compile(r'invalid version [0-9.]+ for pack with ID ([\w_-]+)')
             for error in errors_info:
                 if 'pack id: ' in error:
-                    malformed_ids.extend(error.split('pack id: ')[1].replace(']', '').replace('[', '').replace(
-                        ' ', '').split(','))
+                    malformed_ids.extend(error.split('pack id: ')[1].translate(PACK_IDS_LIST_REMOVED_CHARS).split(','))
                 else:
-                    malformed_pack_id = malformed_pack_pattern.findall(str(error))
+                    malformed_pack_id = MALFORMED_PACK_PATTERN.findall(str(error))
                     if malformed_pack_id and error:
                         malformed_ids.extend(malformed_pack_id)
     return malformed_ids
@@ -17,7 +17,7 @@ from requests import Response
 
 from Tests.Marketplace.marketplace_services import init_storage_client, Pack, \
     load_json, get_content_git_client, get_recent_commits_data, store_successful_and_failed_packs_in_ci_artifacts, \
-    json_write
+    json_write, get_id_set_display_names
 from Tests.Marketplace.marketplace_statistics import StatisticsHandler
 from Tests.Marketplace.marketplace_constants import PackStatus, Metadata, GCPConfig, BucketUploadFlow, \
     CONTENT_ROOT_PATH, PACKS_FOLDER, IGNORED_FILES, LANDING_PAGE_SECTIONS_PATH, SKIPPED_STATUS_CODES, XSOAR_MP, XSOAR_SAAS_MP
@@ -28,7 +28,7 @@ from Tests.scripts.utils import logging_wrapper as logging
 import traceback
 from Tests.Marketplace.pack_readme_handler import download_markdown_images_from_artifacts
 
-METADATA_FILE_REGEX_GET_VERSION = r'metadata\-([\d\.]+)\.json'
+METADATA_FILE_REGEX_GET_VERSION = re.compile(r'metadata\-([\d\.]+)\.json')
 
 
 def get_packs_ids_to_upload(packs_to_upload: str) -> set:
@@ -210,7 +210,7 @@ def update_index_folder(index_folder_path: str, pack: Pack, is_private_pack: boo
         # Remove old metadata files
         if os.path.exists(index_pack_path):
             for d in os.scandir(index_pack_path):
-                if (metadata_version := re.findall(METADATA_FILE_REGEX_GET_VERSION, d.name)) \
+                if (metadata_version := METADATA_FILE_REGEX_GET_VERSION.findall(d.name)) \
                         and pack_versions_to_keep and metadata_version[0] not in pack_versions_to_keep:
                     logging.debug(f"Removing metadata path for pack '{pack.name}': {d.path}")
                     os.remove(d.path)
@@ -1125,12 +1125,14 @@ def main():
     option = option_handler()
     packs_artifacts_path = option.packs_artifacts_path
     id_set = None
+    id_set_display_names = None
     try:
         with Neo4jContentGraphInterface():
             pass
     except Exception as e:
         logging.warning(f"Database is not ready, using id_set.json instead.\n{e}")
         id_set = open_id_set_file(option.id_set_path)
+        id_set_display_names = get_id_set_display_names(id_set)
     extract_destination_path = option.extract_path
     storage_bucket_name = option.bucket_name
     service_account = option.service_account
@@ -1223,7 +1225,8 @@ def main():
             build_number,
             diff_files_list,
             marketplace, id_set,
-            is_override=override_all_packs
+            is_override=override_all_packs,
+            id_set_display_names=id_set_display_names
         )
 
         if not task_status:
@@ -114,11 +114,11 @@ def get_zipped_packs_names(zip_path):
     zip_path = os.path.join(zip_path, 'packs')  # directory of the packs
 
     dir_entries = os.listdir(zip_path)
-    packs_list = [pack.name for pack in os.scandir(PACKS_FULL_PATH)]  # list of all packs from repo
+    packs_names = {pack.name for pack in os.scandir(PACKS_FULL_PATH)}  # names of all packs from repo
 
     for entry in dir_entries:
         entry_path = os.path.join(zip_path, entry)
-        if entry not in IGNORED_FILES and entry in packs_list and os.path.isdir(entry_path):
+        if entry not in IGNORED_FILES and entry in packs_names and os.path.isdir(entry_path):
             # This is a pack directory, should keep only most recent release zip
             pack_files = get_files_in_dir(entry_path, ['zip'])
             latest_zip = get_latest_pack_zip_from_pack_files(entry, pack_files)
@@ -3,6 +3,7 @@ import argparse
 import ast
 import json
 import os
+import re
 import subprocess
 import sys
 import uuid
@@ -85,6 +86,7 @@ ARTIFACTS_FOLDER = os.getenv('ARTIFACTS_FOLDER')
 ARTIFACTS_FOLDER_SERVER_TYPE = os.getenv('ARTIFACTS_FOLDER_SERVER_TYPE')
 ENV_RESULTS_PATH = os.getenv('ENV_RESULTS_PATH', f'{ARTIFACTS_FOLDER_SERVER_TYPE}/env_results.json')
 SET_SERVER_KEYS = True
+PACK_METADATA_DIFF_HEADER_REGEX = re.compile(r'^diff --git a/Packs/([^/]+)/pack_metadata\.json b/', re.MULTILINE)
 
 
 class Running(IntEnum):
@@ -224,6 +226,7 @@ class Build(ABC):
         self.secret_conf = get_json_file(options.secret)
         self.username = options.user if options.user else self.secret_conf.get('username')
         self.password = options.password if options.password else self.secret_conf.get('userPassword')
+        self.secret_params_by_name = group_secret_params_by_name(self.secret_conf.get('integrations', []))
         self.is_private = options.is_private
         conf = get_json_file(options.conf)
         self.tests = conf['tests']
@@ -447,12 +450,12 @@ class Build(ABC):
             placeholders_map = {'%%SERVER_HOST%%': self.servers[0]}
             new_ints_params_set = set_integration_params(self,
                                                          new_integrations,
-                                                         self.secret_conf['integrations'],
+                                                         self.secret_params_by_name,
                                                          instance_names_conf,
                                                          placeholders_map)
             ints_to_configure_params_set = set_integration_params(self,
                                                                   integrations_to_configure,
-                                                                  self.secret_conf['integrations'],
+                                                                  self.secret_params_by_name,
                                                                   instance_names_conf, placeholders_map)
             if not new_ints_params_set:
                 logging.error(f'failed setting parameters for integrations: {new_integrations}')
@@ -1193,6 +1196,23 @@ def change_placeholders_to_values(placeholders_map, config_item):
     return json.loads(item_as_string)
 
 
+def group_secret_params_by_name(secret_params: list[dict]) -> dict[str, list[dict]]:
+    """
+    Index the secret configuration values by integration name, keeping their order in the secret configuration file.
+
+    Arguments:
+        secret_params: (list of dicts)
+            List of secret configuration values for all of our integrations.
+
+    Returns:
+        (dict): The secret configuration values of each integration, by integration name.
+    """
+    secret_params_by_name: dict[str, list[dict]] = {}
+    for item in secret_params:
+        secret_params_by_name.setdefault(item['name'], []).append(item)
+    return secret_params_by_name
+
+
 def set_integration_params(build,
                            integrations,
                            secret_params,
@@ -1214,9 +1234,9 @@ def set_integration_params(build,
         build: Build object
         integrations: (list of dicts)
             List of integration objects whose 'params' attribute will be populated in this function.
-        secret_params: (list of dicts)
-            List of secret configuration values for all of our integrations (as well as specific
-            instances of said integrations).
+        secret_params: (dict)
+            Secret configuration values for all of our integrations (as well as specific
+            instances of said integrations), grouped by integration name (see group_secret_params_by_name).
         instance_names: (list)
             The names of particular instances of an integration to use the secret_params of as the
             configuration values.
@@ -1229,7 +1249,7 @@ def set_integration_params(build,
     """
     for integration in integrations:
         integration_params = [change_placeholders_to_values(placeholders_map, item) for item
-                              in secret_params if item['name'] == integration['name']]
+                              in secret_params.get(integration['name'], [])]
         if integration['name'] == "Core REST API" and build.is_cloud:
             integration_params[0]['params'] = {  # type: ignore
                 "url": build.base_url,
@@ -1713,19 +1733,19 @@ def test_pack_zip(content_path, target, packs: list = None):
             if not test_path.endswith('.yml'):
                 continue
             test = test.name
-            with open(test_path) as test_file:
-                if not (test.startswith(('playbook-', 'script-'))):
-                    test_type = find_type(_dict=yaml.safe_load(test_file), file_type='yml', path=test_path).value
-                    test_file.seek(0)
-                    # we need to convert to the regular filetype if we get a test type, because that what the server expects
-                    if test_type == FileType.TEST_PLAYBOOK.value:
-                        test_type = FileType.PLAYBOOK.value
-                    if test_type == FileType.TEST_SCRIPT.value:
-                        test_type = FileType.SCRIPT.value
-                    test_target = f'test_pack/TestPlaybooks/{test_type}-{test}'
-                else:
-                    test_target = f'test_pack/TestPlaybooks/{test}'
-                zip_file.writestr(test_target, test_file.read())
+            with open(test_path, 'rb') as test_file:
+                test_content = test_file.read()
+            if not (test.startswith(('playbook-', 'script-'))):
+                test_type = find_type(_dict=yaml.safe_load(test_content), file_type='yml', path=test_path).value
+                # we need to convert to the regular filetype if we get a test type, because that what the server expects
+                if test_type == FileType.TEST_PLAYBOOK.value:
+                    test_type = FileType.PLAYBOOK.value
+                if test_type == FileType.TEST_SCRIPT.value:
+                    test_type = FileType.SCRIPT.value
+                test_target = f'test_pack/TestPlaybooks/{test_type}-{test}'
+            else:
+                test_target = f'test_pack/TestPlaybooks/{test}'
+            zip_file.writestr(test_target, test_content)
 
 
 def get_non_added_packs_ids(build: Build):
@@ -1750,11 +1770,11 @@ def get_non_added_packs_ids(build: Build):
     return set(build.pack_ids_to_install) - set(added_pack_ids)
 
 
-def run_git_diff(pack_name: str, build: Build) -> str:
+def run_git_diff(packs_names: set[str], build: Build) -> str:
     """
-    Run git diff command with the specific pack id.
+    Run a single git diff command on the pack_metadata.json of all the given packs.
     Args:
-        pack_name (str): The pack name.
+        packs_names (Set[str]): The pack names.
         build (Build): The build object.
     Returns:
         (str): The git diff output.
@@ -1762,35 +1782,63 @@ def run_git_diff(pack_name: str, build: Build) -> str:
     compare_against = (
         f"origin/master{'' if build.branch_name != 'master' else '~1'}"
     )
-    return run_command(f'git diff {compare_against}..{build.branch_name} -- Packs/{pack_name}/pack_metadata.json')
+    pack_metadata_paths = ' '.join(f'Packs/{pack_name}/pack_metadata.json' for pack_name in sorted(packs_names))
+    return run_command(f'git diff {compare_against}..{build.branch_name} -- {pack_metadata_paths}')
 
 
-def check_hidden_field_changed(pack_name: str, build: Build) -> bool:
+def split_packs_diff(diff: str) -> dict[str, str]:
     """
-    Check if pack turned from hidden to non-hidden.
+    Split a git diff of several pack_metadata.json files by the 'diff --git' header of each file.
+    Args:
+        diff (str): The git diff output.
+    Returns:
+        (Dict[str, str]): The git diff output of each pack's pack_metadata.json, by pack name.
+    """
+    headers = list(PACK_METADATA_DIFF_HEADER_REGEX.finditer(diff))
+    return {
+        header.group(1): diff[header.start():headers[i + 1].start() if i + 1 < len(headers) else len(diff)]
+        for i, header in enumerate(headers)
+    }
+
+
+def get_packs_diffs(packs_names: set[str], build: Build) -> dict[str, str]:
+    """
+    Run git diff once for all the packs, so all the checks on the same pack_metadata.json share its output.
     Args:
-        pack_name (str): The pack name.
+        packs_names (Set[str]): The pack names.
         build (Build): The build object.
+    Returns:
+        (Dict[str, str]): The git diff output of each pack's pack_metadata.json, by pack name.
+    """
+    if not packs_names:
+        return {}
+    packs_diffs = split_packs_diff(run_git_diff(packs_names, build))
+    return {pack_name: packs_diffs.get(pack_name, '') for pack_name in packs_names}
+
+
+def check_hidden_field_changed(diff: str) -> bool:
+    """
+    Check if pack turned from hidden to non-hidden.
+    Args:
+        diff (str): The git diff output of the pack's pack_metadata.json.
     Returns:
         (bool): True if the pack transformed to non-hidden.
     """
-    diff = run_git_diff(pack_name, build)
     return any('"hidden": false' in diff_line and diff_line.split()[0].startswith('+') for diff_line in diff.splitlines())
 
 
-def get_turned_non_hidden_packs(modified_packs_names: set[str], build: Build) -> set[str]:
+def get_turned_non_hidden_packs(modified_packs_diffs: dict[str, str]) -> set[str]:
     """
     Return a set of packs which turned from hidden to non-hidden.
     Args:
-        modified_packs_names (Set[str]): The set of packs to install.
-        build (Build): The build object.
+        modified_packs_diffs (Dict[str, str]): The pack_metadata.json git diff of each pack to install, by pack name.
     Returns:
         (Set[str]): The set of packs names which are turned non-hidden.
     """
     hidden_packs = set()
-    for pack_name in modified_packs_names:
+    for pack_name, diff in modified_packs_diffs.items():
         # check if the pack turned from hidden to non-hidden.
-        if check_hidden_field_changed(pack_name, build):
+        if check_hidden_field_changed(diff):
             hidden_packs.add(pack_name)
     return hidden_packs
 
@@ -1851,18 +1899,17 @@ def update_integration_lists(new_integrations_names: list[str], packs_not_to_ins
     return list(set(new_integrations_names)), modified_integrations_names
 
 
-def filter_new_to_marketplace_packs(build: Build, modified_pack_names: set[str]) -> set[str]:
+def filter_new_to_marketplace_packs(build: Build, modified_packs_diffs: dict[str, str]) -> set[str]:
     """
     Return a set of packs that is new to the marketplace.
     Args:
         build (Build): The build object.
-        modified_pack_names (Set[str]): The set of packs to install.
+        modified_packs_diffs (Dict[str, str]): The pack_metadata.json git diff of each pack to install, by pack name.
     Returns:
         (Set[str]): The set of the pack names that should not be installed.
     """
     first_added_to_marketplace = set()
-    for pack_name in modified_pack_names:
-        diff = run_git_diff(pack_name, build)
+    for pack_name, diff in modified_packs_diffs.items():
         if build.check_if_new_to_marketplace(diff):
             first_added_to_marketplace.add(pack_name)
     return first_added_to_marketplace
@@ -1879,8 +1926,9 @@ def get_packs_to_install(build: Build) -> tuple[set[str], set[str]]:
                                                 that new to current marketplace)
     """
     modified_packs_names = get_non_added_packs_ids(build)
+    modified_packs_diffs = get_packs_diffs(modified_packs_names, build)
 
-    non_hidden_packs = get_turned_non_hidden_packs(modified_packs_names, build)
+    non_hidden_packs = get_turned_non_hidden_packs(modified_packs_diffs)
 
     packs_with_higher_min_version = get_packs_with_higher_min_version(set(build.pack_ids_to_install),
                                                                       build.server_numeric_version)
@@ -1888,7 +1936,8 @@ def get_packs_to_install(build: Build) -> tuple[set[str], set[str]]:
     build.pack_ids_to_install = list(set(build.pack_ids_to_install) - packs_with_higher_min_version)
 
     first_added_to_marketplace = filter_new_to_marketplace_packs(
-        build, modified_packs_names - non_hidden_packs - packs_with_higher_min_version
+        build, {pack_name: modified_packs_diffs[pack_name]
+                for pack_name in modified_packs_names - non_hidden_packs - packs_with_higher_min_version}
     )
 
     packs_not_to_install_in_pre_update = set().union(*[packs_with_higher_min_version,
@@ -452,15 +452,13 @@ def args():
       dict: Arguments object
 
     """
-    if os.path.exists(ARGS_COMMAND_PATH):
+    try:
         with open(ARGS_COMMAND_PATH) as f:
-            try:
-                args = json.load(f)
-            except json.JSONDecodeError:
-                return {}
-            args.pop("cmd", None)
-            return args
-    return {}
+            args = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    args.pop("cmd", None)
+    return args
 
 
 def command():
@@ -471,15 +469,11 @@ def command():
       str: Integrations command name
 
     """
-    if os.path.exists(ARGS_COMMAND_PATH):
+    try:
         with open(ARGS_COMMAND_PATH) as f:
-            try:
-                return json.load(f)["cmd"]
-            except json.JSONDecodeError:
-                return ""
-            except KeyError:
-                return ""
-    return ""
+            return json.load(f)["cmd"]
+    except (IOError, ValueError, KeyError):
+        return ""
 
 
 def log(msg):
@@ -4,12 +4,17 @@ from typing import Any
 
 Nightly_Text = """"""
 
+ERROR_MSG_REGEX = re.compile(r"Error:\s*(.*)")
+ERROR_BODY_REGEX = re.compile(r"(?<=\bBody:\n)[\s\S]+?(?=\n)")
+DID_IT_PASS_REGEX = re.compile(r"Test-Playbook was executed 3 times, and passed only (.*?)(?=\n|$)")
+FAIL_ON_TEST_MODULE_REGEX = re.compile("test-module failed|Failed to execute test-module command.")
+
 
 def main():
     failing_tests = []
-    failing_test_sections: dict[Any, Any] = {}
     is_failing_section = False
-    for row in Nightly_Text.split('\n'):
+    rows = Nightly_Text.split('\n')
+    for row in rows:
         if is_failing_section:
             failing_tests.append(
                 row.strip()[2:].replace(' (Mock Disabled)', '').replace(' (Second Playback)', '').replace('[0m', ''))
@@ -17,46 +22,35 @@ def main():
             is_failing_section = True
         if "Number of succeeded tests" in row:
             is_failing_section = False
-    # extract sections
-    for failing_test in failing_tests[:-1]:
-        iter_row = iter(list(filter(lambda x: x != "", Nightly_Text.split('\n'))))
-        failing_test_sections[failing_test] = []
-        try:
-            while row := next(iter_row):
-                if failing_test in row and "------ Test playbook" in row and "start ------" in row:
-                    while True:
-                        row = next(iter_row)
-                        if "end ------" in row:
-                            break
-                        failing_test_sections[failing_test].append(row)
-        except StopIteration:
-            pass
+    failing_test_sections: dict[Any, Any] = {failing_test: [] for failing_test in failing_tests[:-1]}
+    section_tests: list = []
+    for row in filter(lambda x: x != "", rows):
+        if section_tests:
+            if "end ------" in row:
+                section_tests = []
+            else:
+                for failing_test in section_tests:
+                    failing_test_sections[failing_test].append(row)
+        elif "------ Test playbook" in row and "start ------" in row:
+            section_tests = [failing_test for failing_test in failing_test_sections if failing_test in row]
 
-    error_msg_regex = r"Error:\s*(.*)"
-    error_body_regex = r"(?<=\bBody:\n)[\s\S]+?(?=\n)"
-    did_it_pass_regex = r"Test-Playbook was executed 3 times, and passed only (.*?)(?=\n|$)"
-    fail_on_test_module = "test-module failed|Failed to execute test-module command."
     test_msg: dict[Any, Any] = {}
 
     for key, val in failing_test_sections.items():
-        test_msg[key] = {'error_msgs': [], 'did_it_pass': False, 'fail_on_test_module': False}
+        test_msg[key] = {'error_msgs': set(), 'did_it_pass': False, 'fail_on_test_module': False}
         text = '\n'.join(val)
-        match1 = re.search(error_msg_regex, text)
-        match2 = re.search(error_body_regex, text)
-        match3 = re.search(did_it_pass_regex, text)
-        match4 = re.findall(fail_on_test_module, text)
+        match1 = ERROR_MSG_REGEX.search(text)
+        match2 = ERROR_BODY_REGEX.search(text)
+        match3 = DID_IT_PASS_REGEX.search(text)
+        match4 = FAIL_ON_TEST_MODULE_REGEX.search(text)
         if match1:
-            test_msg[key]['error_msgs'].append(match1.group(1).strip())
+            test_msg[key]['error_msgs'].add(match1.group(1).strip())
         if match2:
-            test_msg[key]['error_msgs'].append(match2.group().strip())
+            test_msg[key]['error_msgs'].add(match2.group().strip())
         if match3 and match3.group(1).strip()[0] == '1':
             test_msg[key]['did_it_pass'] = True
         if match4:
             test_msg[key]['fail_on_test_module'] = True
-    # Remove keys with empty lists
-    test_msg = {key: value for key, value in test_msg.items() if value}
-    for key in test_msg:
-        test_msg[key]['error_msgs'] = list(set(test_msg[key]['error_msgs']))
     with open("/Users/sfainberg/Downloads/failing_tests.csv", 'w', newline='') as file:
         writer = csv.writer(file)
         for key, val in test_msg.items():
@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 
@@ -7,6 +8,8 @@ from demisto_sdk.commands.common.constants import DESCRIPTION_REGEX, FileType
 
 
 IGNORED_FILES = ['.devcontainer/devcontainer.json', '.vscode/extensions.json']
+DESCRIPTION_PATTERN = re.compile(DESCRIPTION_REGEX, re.IGNORECASE)
+SPELL_CHECKED_YML_TYPES = {FileType.INTEGRATION, FileType.BETA_INTEGRATION, FileType.SCRIPT, FileType.PLAYBOOK}
 
 
 def get_modified_files(files_string):
@@ -26,21 +29,22 @@ def get_modified_files(files_string):
         if not file_data:
             continue
 
-        file_status = file_data[0]
+        file_status = file_data[0].lower()
         file_path = file_data[1]
         if file_path in IGNORED_FILES:
             continue
-        if file_path.endswith('.js') or file_path.endswith('.py'):
+        if file_path.endswith(('.js', '.py')):
             continue
-        if file_status.lower().startswith('r'):
+        if file_status.startswith('r'):
             file_path = file_data[2]
 
-        if file_status.lower() == 'm' or file_status.lower() == 'a' or file_status.lower().startswith('r'):
-            if find_type(file_path) in [FileType.INTEGRATION, FileType.BETA_INTEGRATION, FileType.SCRIPT,
-                                        FileType.PLAYBOOK]:
-                yml_files.add(file_path)
-            elif re.match(DESCRIPTION_REGEX, file_path, re.IGNORECASE):
-                md_files.add(file_path)
+        if file_status in ('m', 'a') or file_status.startswith('r'):
+            if file_path.endswith('.yml'):
+                if os.path.getsize(file_path) and find_type(file_path) in SPELL_CHECKED_YML_TYPES:
+                    yml_files.add(file_path)
+            elif DESCRIPTION_PATTERN.match(file_path):
+                if os.path.getsize(file_path):
+                    md_files.add(file_path)
 
     return yml_files, md_files
 
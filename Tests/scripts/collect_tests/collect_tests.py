@@ -280,18 +280,24 @@ class CollectionResult:
         if not other:
             return self
         result = self.__empty_result()
-        result.tests = self.tests | other.tests  # type: ignore[operator]
-        result.modeling_rules_to_test = self.modeling_rules_to_test | other.modeling_rules_to_test
-        result.packs_to_install = self.packs_to_install | other.packs_to_install  # type: ignore[operator]
-        result.packs_to_upload = self.packs_to_upload | other.packs_to_upload
-        result.version_range = self.version_range | other.version_range if self.version_range else other.version_range
-        result.packs_to_reinstall = self.packs_to_reinstall | other.packs_to_reinstall
+        result.__update(self)
+        result.__update(other)
         return result
 
+    def __update(self, other: 'CollectionResult') -> None:
+        self.tests |= other.tests  # type: ignore[operator]
+        self.modeling_rules_to_test |= other.modeling_rules_to_test
+        self.packs_to_install |= other.packs_to_install  # type: ignore[operator]
+        self.packs_to_upload |= other.packs_to_upload
+        self.version_range = self.version_range | other.version_range if self.version_range else other.version_range
+        self.packs_to_reinstall |= other.packs_to_reinstall
+
     @staticmethod
     def union(collected_tests: Sequence[Optional['CollectionResult']] | None) -> Optional['CollectionResult']:
-        non_none = filter(None, collected_tests or (None,))
-        return sum(non_none, start=CollectionResult.__empty_result())
+        result = CollectionResult.__empty_result()
+        for collected in filter(None, collected_tests or (None,)):
+            result.__update(collected)
+        return result
 
     def __repr__(self):
         return f'{len(self.packs_to_install)} packs, {len(self.packs_to_upload)} packs to upload, {len(self.tests)} tests, ' \
@@ -1485,12 +1491,13 @@ def sort_packs_to_upload(packs_to_upload: set[str]) -> tuple[list, list]:
     packs_to_update_metadata = set()
     git_util = GitUtil()
     changed_files = git_util._get_all_changed_files()
+    added_files = git_util.added_files()
     for pack_id in packs_to_upload:
         current_version = PACK_MANAGER.get_current_version(pack_id) or ""
         rn_path = Path(f"Packs/{pack_id}/ReleaseNotes/{current_version.replace('.', '_')}.md")
         pack_metadata_path = Path(f"Packs/{pack_id}/pack_metadata.json")
 
-        if pack_metadata_path in git_util.added_files():  # first version
+        if pack_metadata_path in added_files:  # first version
             continue
 
         if rn_path not in changed_files and pack_metadata_path in changed_files:
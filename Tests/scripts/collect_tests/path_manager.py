@@ -35,14 +35,14 @@ class PathManager:
         logging.debug(f'PathManager uses {self.content_path.resolve()=}, {PathManager.ARTIFACTS_FOLDER_SERVER_TYPE.resolve()=} ')
 
         self.packs_path = self.content_path / 'Packs'
-        self.files_triggering_sanity_tests = self._glob(_SANITY_FILES_FOR_GLOB)
 
         content_root_files = set(filter(lambda f: f.is_file(), self.content_path.iterdir()))
         non_content_files = self._glob(
             filter(lambda p: p.is_dir() and p.name != 'Packs', self.content_path.iterdir()))  # type: ignore[arg-type, union-attr]
         non_content = non_content_files | content_root_files
 
-        infrastructure_test_data = self._glob(('Tests/scripts/infrastructure_tests/tests_data',))
+        self.files_triggering_sanity_tests = self._filter_under(non_content, _SANITY_FILES_FOR_GLOB)
+        infrastructure_test_data = self._filter_under(non_content, ('Tests/scripts/infrastructure_tests/tests_data',))
 
         self.files_to_ignore = (non_content | infrastructure_test_data) - self.files_triggering_sanity_tests
 
@@ -68,7 +68,7 @@ class PathManager:
         if not path.exists():
             logging.error(f'could not find {path} for calculating excluded paths')
         elif path.is_dir():
-            result.update(_ for _ in path.rglob('*') if _.is_file())
+            result.update(Path(root, file) for root, _, files in os.walk(path) for file in files)
         elif '*' in path.name:
             result.update(_ for _ in path.rglob(path.name) if _.is_file())
         elif path.is_file() and '*' not in path.name:
@@ -77,6 +77,20 @@ class PathManager:
             logging.error(f'could not glob {path} - unexpected case')
         return set(result)
 
+    def _filter_under(self, files: set[Path], relative_paths: Iterable[str]) -> set[Path]:
+        """
+        :param files: files under content
+        :param relative_paths: strings representing paths (files or folders) relative to content
+        :return: the files that are, or are under, any of the paths
+        """
+        paths = []
+        for relative_path in relative_paths:
+            path = self.content_path / relative_path
+            if not path.exists():
+                logging.error(f'could not find {path} for calculating excluded paths')
+            paths.append(path)
+        return {file for file in files if any(file.is_relative_to(path) for path in paths)}
+
     def _glob(self, paths: Iterable[str | Path]) -> set[Path]:
         """
         :param paths: to glob
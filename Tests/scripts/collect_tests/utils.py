@@ -1,5 +1,6 @@
 from configparser import ConfigParser, MissingSectionHeaderError
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, NamedTuple
 from collections.abc import Iterator
@@ -145,6 +146,23 @@ class DictBased:
         return tuple(pack_marketplaces)
 
 
+@lru_cache(maxsize=None)
+def read_dict_file(path: Path) -> Any:
+    """
+    Parses a json/yml file once per run, as the same changed file is read by several collection steps.
+    The returned object is shared between callers, and must be treated as read-only.
+
+    :param path: absolute path to a json or yml file
+    :return: the parsed file body
+    """
+    with path.open() as file:
+        match path.suffix:
+            case '.json':
+                return json.load(file)
+            case '.yml':
+                return yaml.load(file)
+
+
 class DictFileBased(DictBased):
     """
     Represents a dictfile (json, yml), allowing access to common attributes (see DictBased)
@@ -162,14 +180,7 @@ class DictFileBased(DictBased):
             raise NonDictException(path)
 
         self.path = path
-        with path.open() as file:
-            match path.suffix:
-                case '.json':
-                    body = json.load(file)
-                case '.yml':
-                    body = yaml.load(file)
-                case _:
-                    raise NonDictException(path)
+        body = read_dict_file(path.absolute())
         try:
             super().__init__(body)
         except NonDictException:
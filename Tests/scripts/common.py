@@ -401,7 +401,7 @@ def create_shame_message(suspicious_commits: list[ProjectCommit],
         A tuple of strings containing the message, the person in charge, the PR link and the color of the message.
     """
     hi_and_status = person_in_charge = in_this_pr = color = ""
-    for suspicious_commit in suspicious_commits:
+    for i, suspicious_commit in enumerate(suspicious_commits):
         name, pr, beginning_of_pr = get_person_in_charge(suspicious_commit)
         if name and pr and beginning_of_pr:
             if name == CONTENT_BOT:
@@ -410,7 +410,7 @@ def create_shame_message(suspicious_commits: list[ProjectCommit],
             msg = "broken" if pipeline_changed_status else "fixed"
             color = "danger" if pipeline_changed_status else "good"
             emoji = ":cry:" if pipeline_changed_status else ":muscle:"
-            if suspicious_commits.index(suspicious_commit) == 0:
+            if i == 0:
                 hi_and_status = f"Hi, The build was {msg} {emoji} by:"
                 person_in_charge = f"@{name}"
                 in_this_pr = f" That was done in this PR: {slack_link(pr, beginning_of_pr)}"
@@ -4,7 +4,7 @@ BRANCH=$2
 SHOULD_CHECKOUT=$3
 
 if [[ -n $BRANCH ]]; then
-  BRANCH=$(git branch --show-current 2>/dev/null) || BRANCH=$(git rev-parse --head) 
+  BRANCH=$(git rev-parse --abbrev-ref HEAD)
 fi
 
 # Checks if there's any diff from master
@@ -22,6 +22,7 @@ JIRA_ISSUE_TYPE = os.environ.get("JIRA_ISSUE_TYPE", "")  # Default to empty stri
 JIRA_COMPONENT = os.environ.get("JIRA_COMPONENT", "")  # Default to empty string if not set
 JIRA_ISSUE_UNRESOLVED_TRANSITION_NAME = os.environ["JIRA_ISSUE_UNRESOLVED_TRANSITION_NAME"]
 JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+JIRA_FILE_NAME_INVALID_CHARS_REGEX = re.compile(r'[^\w-]')
 # Jira additional fields are a json string that will be parsed into a dictionary containing the name of the field
 # as the key and the value as a dictionary containing the value of the field.
 JIRA_ADDITIONAL_FIELDS = json.loads(os.environ.get("JIRA_ADDITIONAL_FIELDS", "{}"))
@@ -55,7 +56,7 @@ def jira_file_link(file_name: str) -> str:
 
 
 def jira_sanitize_file_name(file_name: str) -> str:
-    return re.sub(r'[^\w-]', '-', file_name).lower()
+    return JIRA_FILE_NAME_INVALID_CHARS_REGEX.sub('-', file_name).lower()
 
 
 def jira_color_text(text: str, color: str) -> str:
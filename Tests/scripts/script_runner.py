@@ -3,16 +3,24 @@
 # This is needed because some of our scripts should run in the same working directory as the file they are running on
 # This script should support python2 and should not use external libraries, as it will run in minimal docker containers
 import subprocess
+import multiprocessing
 import os
 import sys
+from multiprocessing.pool import ThreadPool
 
 
 def run_script(args, files):
-    results = []
     try:
-        for file in files:
-            results.append(run_command(args + [os.path.abspath(file)], os.path.dirname(file)))
-        if any(result != 0 for result in results):
+        pool = ThreadPool(multiprocessing.cpu_count())
+        try:
+            results = pool.map(lambda file: run_command(args + [os.path.abspath(file)], os.path.dirname(file)), files)
+        finally:
+            pool.close()
+            pool.join()
+        for _, output in results:
+            sys.stdout.write(output)
+        sys.stdout.flush()
+        if any(returncode != 0 for returncode, _ in results):
             return 1
     except subprocess.CalledProcessError as e:
         print("Error: {e}".format(e=e))  # noqa: T201,UP032
@@ -25,8 +33,12 @@ def run_script(args, files):
 
 def run_command(args, directory):
     if sys.version_info[0] < 3:
-        return subprocess.call(args, cwd=directory)
-    return subprocess.run(args, cwd=directory).returncode
+        process = subprocess.Popen(args, cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output, _ = process.communicate()
+        return process.returncode, output
+    process = subprocess.run(args, cwd=directory, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                             encoding='utf-8', errors='replace')
+    return process.returncode, process.stdout
 
 
 def main():
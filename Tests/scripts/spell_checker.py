@@ -2,9 +2,12 @@
 import sys
 import yaml
 import argparse
+from functools import lru_cache
 
 from spellchecker import SpellChecker
 
+from Tests.scripts.utils.yaml_loader import SafeLoader
+
 DISPLAYABLE_LINES = [
     "description",
     "name",
@@ -19,7 +22,7 @@ def check_yaml(spellchecker, yml_info, unknown_words):
     for key, value in yml_info.items():
         if key in DISPLAYABLE_LINES and isinstance(value, str):
             for word in value.split():
-                if word.isalpha() and spellchecker.unknown([word]):
+                if word.isalpha() and word not in unknown_words and spellchecker.unknown([word]):
                     unknown_words.add(word)
 
         else:
@@ -35,23 +38,28 @@ def check_yaml(spellchecker, yml_info, unknown_words):
 def check_md_file(spellchecker, md_data, unknown_words):
     for line in md_data:
         for word in line.split():
-            if word.isalpha() and spellchecker.unknown([word]):
+            if word.isalpha() and word not in unknown_words and spellchecker.unknown([word]):
                 unknown_words.add(word)
 
 
-def spell_checker(path, is_md=False):
-    unknown_words: set = set([])
+@lru_cache(maxsize=None)
+def get_spellchecker():
+    """Loads the spell checker dictionaries once, as spell_checker is called for every changed file."""
     spellchecker = SpellChecker()
     spellchecker.word_frequency.load_text_file('Tests/known_words.txt')
+    return spellchecker
+
+
+def spell_checker(path, is_md=False):
+    unknown_words: set = set([])
+    spellchecker = get_spellchecker()
 
     if is_md:
         with open(path, 'r') as md_file:
-            md_data = md_file.readlines()
-
-        check_md_file(spellchecker, md_data, unknown_words)
+            check_md_file(spellchecker, md_file, unknown_words)
     else:
         with open(path, 'r') as yaml_file:
-            yml_info = yaml.safe_load(yaml_file)
+            yml_info = yaml.load(yaml_file, Loader=SafeLoader)
 
         check_yaml(spellchecker, yml_info, unknown_words)
 
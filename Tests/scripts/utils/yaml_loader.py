@@ -0,0 +1,6 @@
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+__all__ = ['SafeLoader']
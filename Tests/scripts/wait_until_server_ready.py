@@ -4,6 +4,7 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import CalledProcessError, check_output
 from time import sleep
 from argparse import ArgumentParser
@@ -22,6 +23,9 @@ ARTIFACTS_FOLDER_SERVER_TYPE = os.getenv('ARTIFACTS_FOLDER_SERVER_TYPE')
 ENV_RESULTS_PATH = os.getenv('ENV_RESULTS_PATH', f'{ARTIFACTS_FOLDER_SERVER_TYPE}/env_results.json')
 MAX_TRIES = 30
 PRINT_INTERVAL_IN_SECONDS = 30
+MAX_POLL_INTERVAL_IN_SECONDS = 30
+POLL_INTERVAL_BACKOFF_FACTOR = 1.5
+HEALTH_CHECK_TIMEOUT_IN_SECONDS = 5
 SETUP_TIMEOUT = 60 * 60
 SLEEP_TIME = 45
 NIGHTLY_BUILD_TTL = 12 * 60  # 12 hours
@@ -70,52 +74,65 @@ def main():
     parser.add_argument('--instance-role', help='The instance role', required=True)
     args = parser.parse_args()
 
-    ready_ami_list: list = []
     with open(ENV_RESULTS_PATH) as json_file:
         env_results = json.load(json_file)
         instance_ips = [(env.get('Role'), env.get('InstanceDNS')) for env in env_results]
 
     loop_start_time = time.time()
     last_update_time = loop_start_time
-    instance_ips_to_poll = [ami_instance_ip for ami_instance_name, ami_instance_ip in instance_ips if
-                            ami_instance_name == args.instance_role]
+    poll_interval = 1.0
+    instance_ips_to_poll = {ami_instance_ip for ami_instance_name, ami_instance_ip in instance_ips if
+                            ami_instance_name == args.instance_role}
 
+    session = requests.Session()
     logging.info('Starting wait loop')
     try:
         while instance_ips_to_poll:
             current_time = time.time()
             exit_if_timed_out(loop_start_time, current_time)
 
-            for ami_instance_name, ami_instance_ip in instance_ips:
-                if ami_instance_ip in instance_ips_to_poll:
-                    url = f"https://{ami_instance_ip}/health"
-                    try:
-                        res = requests.request(method="GET", url=url, verify=False)
-                    except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as exp:
-                        logging.error(f'{ami_instance_name} encountered an error: {str(exp)}\n')
-                        if 60 * 10 != SETUP_TIMEOUT:
-                            logging.warning('Setting SETUP_TIMEOUT to 10 minutes.')
-                            SETUP_TIMEOUT = 60 * 10
-                        continue
-                    except Exception:
-                        logging.exception(f'{ami_instance_name} encountered an error, Will retry this step later')
-                        continue
-                    if res.status_code == 200:
-                        if 60 * 60 != SETUP_TIMEOUT:
-                            logging.info('Resetting SETUP_TIMEOUT to an hour.')
-                            SETUP_TIMEOUT = 60 * 60
-                        logging.info(f'Role:{ami_instance_name} server ip:{ami_instance_ip} is ready to use')
-                        instance_ips_to_poll.remove(ami_instance_ip)
-                    # printing the message every 30 seconds
-                    elif current_time - last_update_time > PRINT_INTERVAL_IN_SECONDS:
-                        logging.info(
-                            f'{ami_instance_name} at ip {ami_instance_ip} is not ready yet - waiting for it to start')
+            instances_to_poll = [(ami_instance_name, ami_instance_ip) for ami_instance_name, ami_instance_ip in instance_ips
+                                 if ami_instance_ip in instance_ips_to_poll]
+            with ThreadPoolExecutor(max_workers=len(instances_to_poll)) as executor:
+                health_checks = [executor.submit(session.get, f"https://{ami_instance_ip}/health", verify=False,
+                                                 timeout=HEALTH_CHECK_TIMEOUT_IN_SECONDS)
+                                 for _, ami_instance_ip in instances_to_poll]
+
+            any_server_ready = False
+            for (ami_instance_name, ami_instance_ip), health_check in zip(instances_to_poll, health_checks):
+                try:
+                    res = health_check.result()
+                except requests.exceptions.Timeout:
+                    logging.debug(f'{ami_instance_name} did not answer the health check in time, Will retry')
+                    continue
+                except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as exp:
+                    logging.error(f'{ami_instance_name} encountered an error: {str(exp)}\n')
+                    if 60 * 10 != SETUP_TIMEOUT:
+                        logging.warning('Setting SETUP_TIMEOUT to 10 minutes.')
+                        SETUP_TIMEOUT = 60 * 10
+                    continue
+                except Exception:
+                    logging.exception(f'{ami_instance_name} encountered an error, Will retry this step later')
+                    continue
+                if res.status_code == 200:
+                    if 60 * 60 != SETUP_TIMEOUT:
+                        logging.info('Resetting SETUP_TIMEOUT to an hour.')
+                        SETUP_TIMEOUT = 60 * 60
+                    logging.info(f'Role:{ami_instance_name} server ip:{ami_instance_ip} is ready to use')
+                    instance_ips_to_poll.discard(ami_instance_ip)
+                    any_server_ready = True
+                # printing the message every 30 seconds
+                elif current_time - last_update_time > PRINT_INTERVAL_IN_SECONDS:
+                    logging.info(
+                        f'{ami_instance_name} at ip {ami_instance_ip} is not ready yet - waiting for it to start')
 
             if current_time - last_update_time > PRINT_INTERVAL_IN_SECONDS:
                 # The interval has passed, which means we printed a status update.
                 last_update_time = current_time
-            if len(instance_ips) > len(ready_ami_list):
-                sleep(1)
+            poll_interval = 1.0 if any_server_ready else min(MAX_POLL_INTERVAL_IN_SECONDS,
+                                                              poll_interval * POLL_INTERVAL_BACKOFF_FACTOR)
+            if instance_ips_to_poll:
+                sleep(poll_interval)
     finally:
         instance_ips_to_download_log_files = [ami_instance_ip for ami_instance_name, ami_instance_ip in instance_ips if
                                               ami_instance_name == args.instance_role]
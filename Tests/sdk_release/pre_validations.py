@@ -11,7 +11,7 @@ from Tests.scripts.gitlab_basic_slack_notifier import get_slack_user
 urllib3.disable_warnings()
 
 # regex to validate that the version format is correct e.g: <2.1.3>
-VERSION_FORMAT_REGEX = '\d{1,3}\.\d{1,3}\.\d{1,3}'
+VERSION_FORMAT_REGEX = re.compile(r'\d{1,3}\.\d{1,3}\.\d{1,3}')
 
 GITHUB_USER_URL = 'https://api.github.com/users/{username}'
 GITHUB_BRANCH_URL = 'https://api.github.com/repos/demisto/demisto-sdk/branches/{branch_name}'
@@ -41,7 +41,7 @@ def main():
     errors = []
 
     # validate version format
-    if not re.match(VERSION_FORMAT_REGEX, release_version):
+    if not VERSION_FORMAT_REGEX.match(release_version):
         errors.append(f'The SDK release version {release_version} is not according to the expected format.'
                       f' The format of version should be in x.y.z format, e.g: <2.1.3>')
 
@@ -1,5 +1,4 @@
 import json
-import math
 
 
 class VertexTester:
@@ -162,7 +161,8 @@ def get_tests_allocation_for_threads(number_of_instances, tests_file_path):
     number_of_tests_left = len(all_tests)
     while number_of_tests_left > 0:
         allocations_left = number_of_instances - len(tests_allocation)
-        desired_tests_per_allocation = math.ceil(number_of_tests_left / allocations_left)  # We prefer an equal division of tests.
+        # We prefer an equal division of tests, rounded up using integer division.
+        desired_tests_per_allocation = -(-number_of_tests_left // allocations_left)
         current_allocation = []
 
         # If we have one allocation left, add all tests to it and finish
@@ -413,9 +413,9 @@ def __print_investigation_error(client, playbook_id, investigation_id, logging_m
         empty_json = {"pageSize": 1000}
         res = demisto_client.generic_request_func(self=client, method='POST',
                                                   path='/investigation/' + urllib.parse.quote(
-                                                      investigation_id), body=empty_json)
+                                                      investigation_id), body=empty_json, response_type='object')
         if res and int(res[1]) == 200:
-            resp_json = ast.literal_eval(res[0])
+            resp_json = res[0]
             entries = resp_json['entries']
             logging_manager.error(f'Playbook {playbook_id} has failed:')
             for entry in entries:
@@ -4,7 +4,8 @@ import demisto_client
 import pytest
 from Tests.configure_and_test_integration_instances import XSOARBuild, create_build_object, \
     options_handler, CloudBuild, get_turned_non_hidden_packs, update_integration_lists, \
-    get_packs_with_higher_min_version, filter_new_to_marketplace_packs, packs_names_to_integrations_names
+    get_packs_with_higher_min_version, filter_new_to_marketplace_packs, packs_names_to_integrations_names, \
+    split_packs_diff, group_secret_params_by_name
 
 XSIAM_SERVERS = {
     "qa2-test-111111": {
@@ -132,7 +133,7 @@ NON_HIDDEN_PACKS = [
 
 
 @pytest.mark.parametrize('diff, the_expected_result', NON_HIDDEN_PACKS)
-def test_get_turned_non_hidden_packs(mocker, diff, the_expected_result):
+def test_get_turned_non_hidden_packs(diff, the_expected_result):
     """
     Given:
         - A pack_metadata.json content returned from the git diff.
@@ -141,12 +142,63 @@ def test_get_turned_non_hidden_packs(mocker, diff, the_expected_result):
     Then:
         - Assert the expected result is returned.
     """
-    build = create_build_object_with_mock(mocker, 'XSOAR')
-    mocker.patch('Tests.configure_and_test_integration_instances.run_git_diff', return_value=diff)
-    turned_non_hidden = get_turned_non_hidden_packs({'test'}, build)
+    turned_non_hidden = get_turned_non_hidden_packs({'test': diff})
     assert ('test' in turned_non_hidden) is the_expected_result
 
 
+def test_split_packs_diff():
+    """
+    Given:
+        - A single git diff output of the pack_metadata.json files of two packs.
+    When:
+        - Running 'split_packs_diff' method.
+    Then:
+        - Assert the diff is split by pack, each part holding only its own pack changes.
+    """
+    diff = """diff --git a/Packs/PackA/pack_metadata.json b/Packs/PackA/pack_metadata.json
+index 1111111..2222222 100644
+--- a/Packs/PackA/pack_metadata.json
++++ b/Packs/PackA/pack_metadata.json
+@@ -1,3 +1,3 @@
+-  "hidden": true,
++  "hidden": false,
+diff --git a/Packs/PackB/pack_metadata.json b/Packs/PackB/pack_metadata.json
+index 3333333..4444444 100644
+--- a/Packs/PackB/pack_metadata.json
++++ b/Packs/PackB/pack_metadata.json
+@@ -1,3 +1,3 @@
+-  "currentVersion": "1.0.0",
++  "currentVersion": "1.0.1",
+"""
+    packs_diffs = split_packs_diff(diff)
+    assert set(packs_diffs) == {'PackA', 'PackB'}
+    assert '+  "hidden": false,' in packs_diffs['PackA']
+    assert 'currentVersion' not in packs_diffs['PackA']
+    assert packs_diffs['PackB'].startswith('diff --git a/Packs/PackB/pack_metadata.json')
+    assert 'hidden' not in packs_diffs['PackB']
+    assert get_turned_non_hidden_packs(packs_diffs) == {'PackA'}
+
+
+def test_group_secret_params_by_name():
+    """
+    Given:
+        - Secret configuration values of two integrations, one of them with two instances.
+    When:
+        - Running 'group_secret_params_by_name' method.
+    Then:
+        - Assert the values are grouped by integration name, keeping their original order.
+    """
+    secret_params = [
+        {'name': 'Integration1', 'instance_name': 'instance1', 'params': {}},
+        {'name': 'Integration2', 'params': {}},
+        {'name': 'Integration1', 'instance_name': 'instance2', 'params': {}},
+    ]
+    secret_params_by_name = group_secret_params_by_name(secret_params)
+    assert set(secret_params_by_name) == {'Integration1', 'Integration2'}
+    assert [item['instance_name'] for item in secret_params_by_name['Integration1']] == ['instance1', 'instance2']
+    assert secret_params_by_name['Integration2'] == [secret_params[1]]
+
+
 UPDATE_INTEGRATION_LISTS = [
     (['test1'], ['test2'], ['test2'], lambda new, modified: 'test2' in new and not modified),
     (['test1'], ['test1'], ['test2'], lambda new, modified: 'test2' not in new and 'test2' in modified),
@@ -261,8 +313,7 @@ def test_first_added_to_marketplace(mocker, diff, build_type, the_expected_resul
         - Assert the expected result is returned.
     """
     build = create_build_object_with_mock(mocker, build_type)
-    mocker.patch('Tests.configure_and_test_integration_instances.run_git_diff', return_value=diff)
-    first_added_to_marketplace = filter_new_to_marketplace_packs(build, {'pack_name'})
+    first_added_to_marketplace = filter_new_to_marketplace_packs(build, {'pack_name': diff})
     assert the_expected_result == first_added_to_marketplace
 
 